@@ -55,6 +55,7 @@ from care.facility.models.patient_consultation import (
     PatientConsent,
     PatientConsultation,
 )
+from care.users.api.serializers.skill import SkillSerializer
 from care.users.api.serializers.user import (
     UserAssignedSerializer,
     UserBaseMinimumSerializer,
@@ -68,6 +69,18 @@ from care.utils.serializers.fields import ChoiceField, ExternalIdSerializerField
 MIN_ENCOUNTER_DATE = make_aware(settings.MIN_ENCOUNTER_DATE)
 
 
+class ConsultationAssignedUserSerializer(UserAssignedSerializer):
+    skills = serializers.SerializerMethodField()
+
+    def get_skills(self, user):
+        # PatientConsultationViewSet prefetches the active skills into
+        # `active_skills`, fall back to querying for unprefetched instances
+        skills = getattr(user, "active_skills", None)
+        if skills is None:
+            skills = user.skills.filter(userskill__deleted=False)
+        return SkillSerializer(skills, many=True).data
+
+
 class PatientConsultationSerializer(serializers.ModelSerializer):
     id = serializers.CharField(source="external_id", read_only=True)
     facility_name = serializers.CharField(source="facility.name", read_only=True)
@@ -118,7 +131,9 @@ class PatientConsultationSerializer(serializers.ModelSerializer):
     patient = ExternalIdSerializerField(queryset=PatientRegistration.objects.all())
     facility = ExternalIdSerializerField(read_only=True)
 
-    assigned_to_object = UserAssignedSerializer(source="assigned_to", read_only=True)
+    assigned_to_object = ConsultationAssignedUserSerializer(
+        source="assigned_to", read_only=True
+    )
     assigned_to = serializers.PrimaryKeyRelatedField(
         queryset=User.objects.all(), required=False, allow_null=True
     )
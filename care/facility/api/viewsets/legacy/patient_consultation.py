@@ -1,5 +1,6 @@
 from django.db import transaction
 from django.db.models import Prefetch
+from django.db.models.fields.json import KT
 from django.db.models.query_utils import Q
 from django.shortcuts import get_object_or_404
 from django_filters import rest_framework as filters
@@ -20,6 +21,7 @@ from care.facility.api.serializers.patient_consultation import (
     PatientConsultationSerializer,
 )
 from care.facility.api.viewsets.mixins.access import AssetUserAccessMixin
+from care.facility.models.asset import Asset
 from care.facility.models.bed import AssetBed, ConsultationBed
 from care.facility.models.mixins.permissions.asset import IsAssetUser
 from care.facility.models.patient_consultation import (
@@ -27,9 +29,30 @@ from care.facility.models.patient_consultation import (
     PatientConsultation,
 )
 from care.users.models import Skill, User
-from care.utils.cache.cache_allowed_facilities import get_accessible_facilities
+from care.utils.cache.cache_allowed_facilities import (
+    get_accessible_facilities_queryset,
+)
+from care.utils.filters.backends import CachedDjangoFilterBackend
 from care.utils.queryset.consultation import get_consultation_queryset
 
+_STATE_LAB_ADMIN = User.TYPE_VALUE_MAP["StateLabAdmin"]
+_DISTRICT_LAB_ADMIN = User.TYPE_VALUE_MAP["DistrictLabAdmin"]
+_CONSULTATION_FIELDS = [f.name for f in PatientConsultation._meta.concrete_fields]  # noqa: SLF001
+
+
+def _build_consultation_filter(user, allowed_facilities):
+    # A user should be able to see all the consultations of a patient if the patient is active in an accessible facility
+    accessible = PatientConsultation.objects.filter(
+        patient__is_active=True, patient__facility_id__in=allowed_facilities
+    ).values("id")
+    # A user should be able to see all consultations part of their home facility
+    home_facility = PatientConsultation.objects.filter(
+        facility_id=user.home_facility_id
+    ).values("id")
+    # UNION ALL lets the planner use the best index for each branch, an OR
+    # across the two join paths can't
+    return Q(id__in=accessible.union(home_facility, all=True))
+
 
 class PatientConsultationFilter(filters.FilterSet):
     patient = filters.CharFilter(field_name="patient__external_id")
@@ -53,7 +76,7 @@ class PatientConsultationViewSet(
     queryset = (
         PatientConsultation.objects.all().select_related("facility").order_by("-id")
     )
-    filter_backends = (filters.DjangoFilterBackend,)
+    filter_backends = (CachedDjangoFilterBackend,)
     filterset_class = PatientConsultationFilter
 
     def get_serializer_class(self):
@@ -71,36 +94,56 @@ class PatientConsultationViewSet(
         return super().get_permissions()
 
     def get_queryset(self):
+        # DRF calls this once per action, the memo only keeps any further
+        # calls within the same request from rebuilding the filters
+        if hasattr(self, "_cached_qs"):
+            return self._cached_qs
         queryset = super().get_queryset()
-        if self.serializer_class == PatientConsultationSerializer:
-            queryset = queryset.prefetch_related(
+        # Only actions rendering the full consultation need the related rows,
+        # discharge and other detail actions skip the extra queries
+        if self.get_serializer_class() == PatientConsultationSerializer:
+            queryset = queryset.select_related(
                 "assigned_to",
+                "current_bed",
+                "current_bed__bed",
+            ).prefetch_related(
                 Prefetch(
                     "assigned_to__skills",
-                    queryset=Skill.objects.filter(userskill__deleted=False),
+                    queryset=Skill.objects.filter(userskill__deleted=False).only(
+                        "external_id", "name", "description"
+                    ),
+                    to_attr="active_skills",
+                ),
+                Prefetch(
+                    "current_bed__assets",
+                    queryset=Asset.objects.select_related("current_location"),
                 ),
-                "current_bed",
-                "current_bed__bed",
-                "current_bed__assets",
-                "current_bed__assets__current_location",
             )
+            if self.action == "list":
+                # The serializer renders every consultation column but only
+                # the name and external id of the joined facility
+                queryset = queryset.only(
+                    *_CONSULTATION_FIELDS,
+                    "facility__external_id",
+                    "facility__name",
+                )
         if self.request.user.is_superuser:
-            return queryset
-        if self.request.user.user_type >= User.TYPE_VALUE_MAP["StateLabAdmin"]:
-            return queryset.filter(patient__facility__state=self.request.user.state)
-        if self.request.user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]:
-            return queryset.filter(
+            pass
+        elif self.request.user.user_type >= _STATE_LAB_ADMIN:
+            queryset = queryset.filter(patient__facility__state=self.request.user.state)
+        elif self.request.user.user_type >= _DISTRICT_LAB_ADMIN:
+            queryset = queryset.filter(
                 patient__facility__district=self.request.user.district
             )
-        allowed_facilities = get_accessible_facilities(self.request.user)
-        # A user should be able to see all the consultations of a patient if the patient is active in an accessible facility
-        applied_filters = Q(
-            Q(patient__is_active=True) & Q(patient__facility__id__in=allowed_facilities)
-        )
-        # A user should be able to see all consultations part of their home facility
-        applied_filters |= Q(facility=self.request.user.home_facility)
-        # applied_filters |= Q(patient__assigned_to=self.request.user)
-        return queryset.filter(applied_filters)
+        else:
+            queryset = queryset.filter(
+                _build_consultation_filter(
+                    self.request.user,
+                    get_accessible_facilities_queryset(self.request.user),
+                )
+            )
+        self._cached_qs = queryset
+        return queryset
 
     @transaction.non_atomic_requests
     def create(self, request, *args, **kwargs) -> Response:
@@ -120,44 +163,54 @@ class PatientConsultationViewSet(
     )
     @action(detail=False, methods=["GET"])
     def patient_from_asset(self, request):
-        consultation_bed = (
-            ConsultationBed.objects.filter(
-                Q(assets=request.user.asset)
-                | Q(bed__in=request.user.asset.bed_set.all()),
-                end_date__isnull=True,
-            )
+        asset = request.user.asset
+        # Look up the asset's own consultation beds and the ones on its beds
+        # separately, an OR across both join paths can't use either index
+        consultation_beds = (
+            ConsultationBed.objects.filter(end_date__isnull=True)
             .order_by("-id")
-            .first()
+            .values("id", "bed_id", "bed__external_id")
         )
-        if not consultation_bed:
+        candidates = list(consultation_beds.filter(assets=asset)[:1])
+        if bed_ids := list(asset.bed_set.values_list("id", flat=True)):
+            candidates += consultation_beds.filter(bed_id__in=bed_ids)[:1]
+        if not candidates:
             raise NotFound({"detail": "No consultation bed found for this asset"})
+        consultation_bed = max(candidates, key=lambda bed: bed["id"])
 
-        consultation = (
-            PatientConsultation.objects.order_by("-id")
-            .filter(
-                current_bed=consultation_bed,
-                patient__is_active=True,
+        try:
+            consultation = (
+                PatientConsultation.objects.filter(
+                    current_bed_id=consultation_bed["id"],
+                    patient__is_active=True,
+                )
+                .select_related("patient")
+                .only("external_id", "patient__external_id")
+                .latest("id")
             )
-            .only("external_id", "patient__external_id")
-            .first()
-        )
-        if not consultation:
-            raise NotFound({"detail": "No consultation found for this asset"})
+        except PatientConsultation.DoesNotExist as e:
+            raise NotFound({"detail": "No consultation found for this asset"}) from e
 
         asset_beds = []
         if preset_name := request.query_params.get("preset_name", None):
-            asset_beds = AssetBed.objects.filter(
-                asset__current_location=request.user.asset.current_location,
-                bed=consultation_bed.bed,
-                meta__preset_name__icontains=preset_name,
-            ).select_related("bed", "asset")
+            asset_beds = list(
+                AssetBed.objects.alias(preset_name=KT("meta__preset_name"))
+                .filter(
+                    asset__current_location=asset.current_location,
+                    bed_id=consultation_bed["bed_id"],
+                    preset_name__icontains=preset_name,
+                )
+                .select_related(
+                    "bed__location__facility", "asset__current_location__facility"
+                )
+            )
 
         return Response(
             PatientConsultationIDSerializer(
                 {
                     "patient_id": consultation.patient.external_id,
                     "consultation_id": consultation.external_id,
-                    "bed_id": consultation_bed.bed.external_id,
+                    "bed_id": consultation_bed["bed__external_id"],
                     "asset_beds": asset_beds,
                 }
             ).data
@@ -179,19 +232,28 @@ class PatientConsentViewSet(
         DRYPermissions,
     )
     queryset = PatientConsent.objects.all().select_related("consultation")
-    filter_backends = (filters.DjangoFilterBackend,)
+    filter_backends = (CachedDjangoFilterBackend,)
 
     filterset_fields = ("archived",)
 
-    def get_consultation_obj(self):
-        return get_object_or_404(
-            get_consultation_queryset(self.request.user).filter(
-                external_id=self.kwargs["consultation_external_id"]
-            )
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._consultation = get_object_or_404(
+            get_consultation_queryset(request.user)
+            .select_related("facility", "patient")
+            .filter(external_id=self.kwargs["consultation_external_id"])
         )
 
+    def get_consultation_obj(self):
+        return self._consultation
+
     def get_queryset(self):
-        return self.queryset.filter(consultation=self.get_consultation_obj())
+        queryset = self.queryset.filter(consultation=self.get_consultation_obj())
+        if self.action == "list":
+            # Every listed consent belongs to the consultation resolved in
+            # initial(), joining its wide row again for each consent is wasted
+            queryset = queryset.select_related(None)
+        return queryset
 
     def get_serializer_context(self):
         data = super().get_serializer_context()
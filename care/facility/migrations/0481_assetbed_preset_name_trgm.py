@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-15 10:12
+
+import django.contrib.postgres.indexes
+import django.db.models.fields.json
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facility', '0480_delete_patientorganizations'),
+    ]
+
+    operations = [
+        # pg_trgm is also used by patient name search, never drop it on reverse
+        migrations.RunSQL(
+            'CREATE EXTENSION IF NOT EXISTS pg_trgm;',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='assetbed',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.fields.json.KT('meta__preset_name')), name='gin_trgm_ops'), name='assetbed_preset_name_trgm'),
+        ),
+    ]
@@ -5,9 +5,12 @@ However this is an addon feature and is not required for the regular patient flo
 Leaving scope to build rooms and wards to being even more organization.
 """
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import JSONField
+from django.db.models.fields.json import KT
+from django.db.models.functions import Upper
 
 from care.facility.models.asset import Asset, AssetLocation
 from care.facility.models.facility import Facility
@@ -76,6 +79,13 @@ class AssetBed(BaseModel):
                 condition=models.Q(deleted=False),
             ),
         ]
+        indexes = [
+            # icontains compiles to UPPER(...) LIKE UPPER(...) on postgres
+            GinIndex(
+                OpClass(Upper(KT("meta__preset_name")), name="gin_trgm_ops"),
+                name="assetbed_preset_name_trgm",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.asset.name} - {self.bed.name}"
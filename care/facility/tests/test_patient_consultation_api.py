@@ -1,19 +1,29 @@
 import datetime
 from unittest.mock import patch
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import make_aware, now
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
 
-from care.facility.api.serializers.patient_consultation import MIN_ENCOUNTER_DATE
-from care.facility.models.bed import Bed
+from care.facility.api.serializers.patient_consultation import (
+    MIN_ENCOUNTER_DATE,
+    ConsultationAssignedUserSerializer,
+)
+from care.facility.api.viewsets.legacy.patient_consultation import (
+    PatientConsultationViewSet,
+)
+from care.facility.models.bed import AssetBed, Bed
 from care.facility.models.encounter_symptom import Symptom
 from care.facility.models.file_upload import FileUpload
+from care.facility.models.patient import PatientRegistration
 from care.facility.models.patient_base import NewDischargeReasonEnum, SuggestionChoices
 from care.facility.models.patient_consultation import (
     CATEGORY_CHOICES,
     PatientConsultation,
 )
+from care.users.models import Skill, UserSkill
 from care.utils.tests.test_utils import TestUtils
 
 
@@ -518,3 +528,224 @@ class TestPatientConsultation(TestUtils, APITestCase):
         )
 
         self.assertEqual(consultation.current_bed.bed, bed)
+
+
+class TestConsultationAssignedUserSkills(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.doctor = cls.create_user(
+            "doctor", cls.district, home_facility=cls.facility, user_type=15
+        )
+        cls.patient = cls.create_patient(cls.district, cls.facility)
+        cls.consultation = cls.create_consultation(
+            cls.patient, cls.facility, assigned_to=cls.doctor
+        )
+        cls.active_skill = Skill.objects.create(name="cardiology", description="heart")
+        cls.removed_skill = Skill.objects.create(name="neurology", description="brain")
+        UserSkill.objects.create(user=cls.doctor, skill=cls.active_skill)
+        UserSkill.objects.create(user=cls.doctor, skill=cls.removed_skill).delete()
+
+    def get_listed_consultation(self):
+        request = APIRequestFactory().get("/")
+        request.user = self.super_user
+        view = PatientConsultationViewSet(
+            action="list", request=request, format_kwarg=None
+        )
+        return view.get_queryset().get(id=self.consultation.id)
+
+    def expected_skills(self):
+        return [
+            {
+                "id": str(self.active_skill.external_id),
+                "name": self.active_skill.name,
+                "description": self.active_skill.description,
+            }
+        ]
+
+    def test_prefetched_skills_exclude_deleted_links(self):
+        consultation = self.get_listed_consultation()
+        with self.assertNumQueries(0):
+            data = ConsultationAssignedUserSerializer(consultation.assigned_to).data
+        self.assertEqual(data["skills"], self.expected_skills())
+
+    def test_unprefetched_skills_match_prefetched(self):
+        prefetched = ConsultationAssignedUserSerializer(
+            self.get_listed_consultation().assigned_to
+        ).data
+        fallback = ConsultationAssignedUserSerializer(self.doctor).data
+        self.assertEqual(fallback["skills"], self.expected_skills())
+        self.assertEqual(fallback["skills"], prefetched["skills"])
+
+
+class TestConsultationAccessFilter(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.home_facility = cls.create_facility(
+            cls.super_user, cls.district, cls.local_body, name="Home"
+        )
+        cls.linked_facility = cls.create_facility(
+            cls.super_user, cls.district, cls.local_body, name="Linked"
+        )
+        cls.other_facility = cls.create_facility(
+            cls.super_user, cls.district, cls.local_body, name="Other"
+        )
+        cls.user = cls.create_user(
+            "nurse", cls.district, home_facility=cls.home_facility
+        )
+        cls.link_user_with_facility(cls.user, cls.linked_facility, cls.super_user)
+
+    def create_consultation_for(self, patient_facility, facility, is_active=True):
+        patient = self.create_patient(self.district, patient_facility)
+        consultation = self.create_consultation(patient, facility)
+        PatientRegistration.objects.filter(id=patient.id).update(
+            facility=patient_facility, is_active=is_active
+        )
+        return consultation
+
+    def get_visible_consultations(self):
+        request = APIRequestFactory().get("/")
+        request.user = self.user
+        view = PatientConsultationViewSet(
+            action="list", request=request, format_kwarg=None
+        )
+        return set(view.get_queryset().values_list("id", flat=True))
+
+    def test_active_patient_in_linked_facility_is_visible(self):
+        consultation = self.create_consultation_for(
+            self.linked_facility, self.other_facility
+        )
+        self.assertIn(consultation.id, self.get_visible_consultations())
+
+    def test_inactive_patient_in_linked_facility_is_hidden(self):
+        consultation = self.create_consultation_for(
+            self.linked_facility, self.other_facility, is_active=False
+        )
+        self.assertNotIn(consultation.id, self.get_visible_consultations())
+
+    def test_home_facility_consultation_is_visible(self):
+        consultation = self.create_consultation_for(
+            self.other_facility, self.home_facility
+        )
+        self.assertIn(consultation.id, self.get_visible_consultations())
+
+    def test_unrelated_consultation_is_hidden(self):
+        consultation = self.create_consultation_for(
+            self.other_facility, self.other_facility
+        )
+        self.assertNotIn(consultation.id, self.get_visible_consultations())
+
+
+class TestPatientFromAsset(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.location = cls.create_asset_location(cls.facility)
+        cls.asset = cls.create_asset(cls.location)
+        cls.asset_user = cls.create_user("asset_user", cls.district, asset=cls.asset)
+        cls.asset_bed = cls.create_bed(cls.facility, cls.location, name="Asset Bed")
+        cls.other_bed = cls.create_bed(cls.facility, cls.location, name="Other Bed")
+        cls.create_assetbed(cls.asset_bed, cls.asset)
+
+    def occupy_bed(self, bed, asset=None, patient_active=True):
+        patient = self.create_patient(self.district, self.facility)
+        consultation = self.create_consultation(patient, self.facility)
+        consultation_bed = self.create_consultation_bed(consultation, bed)
+        if asset:
+            consultation_bed.assets.add(asset)
+        PatientConsultation.objects.filter(id=consultation.id).update(
+            current_bed=consultation_bed
+        )
+        if not patient_active:
+            PatientRegistration.objects.filter(id=patient.id).update(is_active=False)
+        return consultation
+
+    def get_patient_from_asset(self, user, **query_params):
+        request = APIRequestFactory().get(
+            "/api/v1/consultation/patient_from_asset/", query_params
+        )
+        force_authenticate(request, user=user)
+        view = PatientConsultationViewSet.as_view({"get": "patient_from_asset"})
+        return view(request)
+
+    def test_newer_bed_of_asset_wins_over_linked_asset(self):
+        self.occupy_bed(self.other_bed, asset=self.asset)
+        consultation = self.occupy_bed(self.asset_bed)
+        res = self.get_patient_from_asset(self.asset_user)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["consultation_id"], str(consultation.external_id))
+        self.assertEqual(res.data["bed_id"], str(self.asset_bed.external_id))
+
+    def test_newer_linked_asset_wins_over_bed_of_asset(self):
+        self.occupy_bed(self.asset_bed)
+        consultation = self.occupy_bed(self.other_bed, asset=self.asset)
+        res = self.get_patient_from_asset(self.asset_user)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["consultation_id"], str(consultation.external_id))
+        self.assertEqual(res.data["bed_id"], str(self.other_bed.external_id))
+
+    def test_asset_without_beds_resolves_through_linked_asset(self):
+        asset = self.create_asset(self.location, name="Bedless Asset")
+        user = self.create_user("bedless_asset_user", self.district, asset=asset)
+        consultation = self.occupy_bed(self.other_bed, asset=asset)
+        res = self.get_patient_from_asset(user)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["consultation_id"], str(consultation.external_id))
+        self.assertEqual(res.data["patient_id"], str(consultation.patient.external_id))
+
+    def test_no_open_consultation_bed(self):
+        res = self.get_patient_from_asset(self.asset_user)
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(res.data["detail"], "No consultation bed found for this asset")
+
+    def test_inactive_patient(self):
+        self.occupy_bed(self.asset_bed, patient_active=False)
+        res = self.get_patient_from_asset(self.asset_user)
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(res.data["detail"], "No consultation found for this asset")
+
+    def test_preset_name_filter(self):
+        self.occupy_bed(self.asset_bed)
+        asset_bed = AssetBed.objects.get(asset=self.asset, bed=self.asset_bed)
+        asset_bed.meta = {"preset_name": "Bed Overview"}
+        asset_bed.save(update_fields=["meta"])
+        self.create_assetbed(
+            self.asset_bed,
+            self.create_asset(self.location, name="Other Camera"),
+            meta={"preset_name": "Door"},
+        )
+
+        with CaptureQueriesContext(connection) as single_match:
+            res = self.get_patient_from_asset(
+                self.asset_user, preset_name="bed OVERVIEW"
+            )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in res.data["asset_beds"]],
+            [str(asset_bed.external_id)],
+        )
+
+        # Locations and their facilities come from the join, so another
+        # matching asset bed must not add any queries
+        self.create_assetbed(
+            self.asset_bed,
+            self.create_asset(self.location, name="Second Camera"),
+            meta={"preset_name": "Bed Overview Wide"},
+        )
+        with self.assertNumQueries(len(single_match)):
+            res = self.get_patient_from_asset(
+                self.asset_user, preset_name="bed OVERVIEW"
+            )
+        self.assertEqual(len(res.data["asset_beds"]), 2)
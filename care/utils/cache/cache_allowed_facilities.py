@@ -16,3 +16,11 @@ def get_accessible_facilities(user):
         cache.set(key, facility_ids)
         return facility_ids
     return hit
+
+
+def get_accessible_facilities_queryset(user):
+    """
+    Subquery variant of `get_accessible_facilities`, usable as the right hand
+    side of an `__in` lookup without inlining every facility id into the SQL.
+    """
+    return FacilityUser.objects.filter(user_id=user.id).values("facility_id")
@@ -0,0 +1,21 @@
+from django_filters import rest_framework as filters
+
+_filterset_class_cache = {}
+
+
+class CachedDjangoFilterBackend(filters.DjangoFilterBackend):
+    """
+    Memoizes the resolved FilterSet class per view class and model, so views
+    using `filterset_fields` don't rebuild an AutoFilterSet on every request.
+
+    Views that change `filterset_class` or `filterset_fields` per action must
+    not use this backend, the first resolved class would be reused for all.
+    """
+
+    def get_filterset_class(self, view, queryset=None):
+        if queryset is None:
+            return super().get_filterset_class(view, queryset)
+        key = (type(view), queryset.model)
+        if key not in _filterset_class_cache:
+            _filterset_class_cache[key] = super().get_filterset_class(view, queryset)
+        return _filterset_class_cache[key]
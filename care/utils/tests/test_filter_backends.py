@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+from django_filters import rest_framework as filters
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from care.facility.api.viewsets.legacy.patient_consultation import (
+    PatientConsentViewSet,
+    PatientConsultationViewSet,
+)
+from care.facility.models.patient_consultation import ConsentType, PatientConsent
+from care.utils.filters.backends import (
+    CachedDjangoFilterBackend,
+    _filterset_class_cache,
+)
+from care.utils.tests.test_utils import TestUtils
+
+
+class CachedDjangoFilterBackendTestCase(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.doctor = cls.create_user(
+            "doctor", cls.district, home_facility=cls.facility, user_type=15
+        )
+        cls.patient = cls.create_patient(cls.district, cls.facility)
+        cls.consultation = cls.create_consultation(
+            cls.patient, cls.facility, cls.doctor
+        )
+        cls.active_consent = cls.create_patient_consent(
+            cls.consultation, created_by=cls.doctor
+        )
+        cls.archived_consent = cls.create_patient_consent(
+            cls.consultation,
+            type=ConsentType.CONSENT_FOR_ADMISSION,
+            patient_code_status=None,
+            created_by=cls.doctor,
+            archived=True,
+        )
+
+    def setUp(self):
+        _filterset_class_cache.clear()
+        super().setUp()
+
+    def get_request(self, **query_params):
+        return Request(APIRequestFactory().get("/", query_params))
+
+    def test_auto_filterset_is_built_once(self):
+        queryset = PatientConsent.objects.all()
+        with patch.object(
+            filters.DjangoFilterBackend,
+            "get_filterset_class",
+            autospec=True,
+            side_effect=filters.DjangoFilterBackend.get_filterset_class,
+        ) as upstream:
+            first = CachedDjangoFilterBackend().get_filterset_class(
+                PatientConsentViewSet(), queryset
+            )
+            second = CachedDjangoFilterBackend().get_filterset_class(
+                PatientConsentViewSet(), queryset
+            )
+        self.assertEqual(upstream.call_count, 1)
+        self.assertIs(first, second)
+        self.assertIn("archived", first.base_filters)
+
+    def test_archived_filter_is_applied(self):
+        backend = CachedDjangoFilterBackend()
+        queryset = PatientConsent.objects.all()
+
+        archived = backend.filter_queryset(
+            self.get_request(archived="true"), queryset, PatientConsentViewSet()
+        )
+        self.assertQuerySetEqual(archived, [self.archived_consent])
+
+        active = backend.filter_queryset(
+            self.get_request(archived="false"), queryset, PatientConsentViewSet()
+        )
+        self.assertQuerySetEqual(active, [self.active_consent])
+
+    def test_missing_queryset_bypasses_cache(self):
+        backend = CachedDjangoFilterBackend()
+        self.assertIsNone(backend.get_filterset_class(PatientConsentViewSet()))
+        self.assertIs(
+            backend.get_filterset_class(PatientConsultationViewSet()),
+            PatientConsultationViewSet.filterset_class,
+        )
+        self.assertEqual(_filterset_class_cache, {})